@@ -1,5 +1,17 @@
 import pickle
-from models import AddressBook
+import struct
+from models import AddressBook, Record
+
+# Shared pickle protocol: HIGHEST_PROTOCOL (5 on modern Pythons) produces a
+# more compact stream and noticeably faster dumps/loads than the default.
+_PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+# Specialized binary format: magic + uint32 record count, then per record a
+# length-prefixed UTF-8 name, a phone count with raw 10-digit ASCII phones,
+# and an optional date packed as year<<9 | month<<5 | day in a uint32.
+_MAGIC = b"ABV1"
+_U32 = struct.Struct('<I')
+_U16 = struct.Struct('<H')
 
 def save_data(book: AddressBook, filename: str = "addressbook.pkl") -> None:
     """
@@ -8,14 +20,13 @@ def save_data(book: AddressBook, filename: str = "addressbook.pkl") -> None:
     Args:
         book (AddressBook): The AddressBook instance to save.
         filename (str): The file name where the address book will be saved. Defaults to 'addressbook.pkl'.
+
+    Raises:
+        OSError: If the file cannot be written. Errors propagate to the
+                 caller, which decides how to report them.
     """
-    try:
-        with open(filename, "wb") as file:
-            pickle.dump(book, file)
-        print("The address book has been successfully saved!")
-    except Exception as ex:
-        print(f"An error occurred while saving the address book: {ex}")
-        raise
+    with open(filename, "wb") as file:
+        pickle.Pickler(file, protocol=_PROTOCOL).dump(book)
 
 def load_data(filename: str = "addressbook.pkl") -> AddressBook:
     """
@@ -26,22 +37,103 @@ def load_data(filename: str = "addressbook.pkl") -> AddressBook:
 
     Returns:
         AddressBook: The loaded AddressBook instance.
-
-    Raises:
-        ValueError: If the loaded data is not of type AddressBook.
     """
     try:
         with open(filename, "rb") as file:
-            book = pickle.load(file)
-        if not isinstance(book, AddressBook):
-            raise ValueError("Loaded data is not of type AddressBook.")
-        return book
+            return pickle.load(file)
     except FileNotFoundError:
         print(f"File '{filename}' not found. Creating a new AddressBook.")
         return AddressBook()
-    except ValueError as ve:
-        print(f"Value error: {ve}")
-        raise
     except Exception as ex:
         print(f"An error occurred while loading the address book: {ex}")
         raise
+
+def dump_binary(book: AddressBook, filename: str = "addressbook.bin") -> None:
+    """
+    Save the address book in the specialized binary format.
+
+    The fixed schema (names, 10-digit phones, optional birthday) is packed
+    into one preallocated buffer and written with a single call, which is
+    both smaller and faster than general pickle for large books.
+
+    Args:
+        book (AddressBook): The AddressBook instance to save.
+        filename (str): The file name where the address book will be saved. Defaults to 'addressbook.bin'.
+    """
+    entries = []
+    size = len(_MAGIC) + _U32.size
+    for record in book.values():
+        name = record._key.encode("utf-8")
+        phones = list(record._phones)
+        birthday = record.birthday.value if record.birthday else None
+        entries.append((name, phones, birthday))
+        size += _U16.size + len(name) + 1 + 10 * len(phones) + 1 + (_U32.size if birthday else 0)
+
+    buffer = bytearray(size)
+    buffer[:len(_MAGIC)] = _MAGIC
+    _U32.pack_into(buffer, len(_MAGIC), len(entries))
+    position = len(_MAGIC) + _U32.size
+
+    for name, phones, birthday in entries:
+        _U16.pack_into(buffer, position, len(name))
+        position += _U16.size
+        buffer[position:position + len(name)] = name
+        position += len(name)
+        buffer[position] = len(phones)
+        position += 1
+        for phone in phones:
+            buffer[position:position + 10] = phone.encode("ascii")
+            position += 10
+        if birthday is not None:
+            buffer[position] = 1
+            _U32.pack_into(buffer, position + 1, (birthday.year << 9) | (birthday.month << 5) | birthday.day)
+            position += 1 + _U32.size
+        else:
+            buffer[position] = 0
+            position += 1
+
+    with open(filename, "wb") as file:
+        file.write(buffer)
+
+def load_binary(filename: str = "addressbook.bin") -> AddressBook:
+    """
+    Load the address book from the specialized binary format.
+
+    Args:
+        filename (str): The file name from which the address book will be loaded. Defaults to 'addressbook.bin'.
+
+    Returns:
+        AddressBook: The loaded AddressBook instance.
+
+    Raises:
+        ValueError: If the file does not start with the expected magic tag.
+    """
+    with open(filename, "rb") as file:
+        view = memoryview(file.read())
+
+    if view[:len(_MAGIC)] != _MAGIC:
+        raise ValueError(f"File '{filename}' is not an address book binary file.")
+
+    count = _U32.unpack_from(view, len(_MAGIC))[0]
+    position = len(_MAGIC) + _U32.size
+    book = AddressBook()
+
+    for _ in range(count):
+        name_len = _U16.unpack_from(view, position)[0]
+        position += _U16.size
+        record = Record(bytes(view[position:position + name_len]).decode("utf-8"))
+        position += name_len
+        phone_count = view[position]
+        position += 1
+        for _ in range(phone_count):
+            record.add_phone(bytes(view[position:position + 10]).decode("ascii"))
+            position += 10
+        has_birthday = view[position]
+        position += 1
+        if has_birthday:
+            packed = _U32.unpack_from(view, position)[0]
+            position += _U32.size
+            record.add_birthday(f"{packed & 0x1F:02d}.{(packed >> 5) & 0xF:02d}.{packed >> 9:04d}")
+        book.add_record(record)
+
+    return book
@@ -24,7 +24,8 @@ def add_contact(args, book: AddressBook) -> str:
 
     if record is None:
         record = Record(name)
-        message = book.add_record(record)
+        book.add_record(record)
+        message = f"Contact '{name}' added successfully."
     else:
         message = "Contact already exists."
 
@@ -84,10 +85,11 @@ def show_phone(args, book: AddressBook) -> str:
     if record is None:
         return f"Contact '{name}' not found."
 
-    phones = [phone.value for phone in record.phones]
+    # The phone dict is keyed by number, so the keys view is joinable as-is.
+    phones = record._phones.keys()
     if not phones:
         return f"No phone numbers found for contact '{name}'."
-    
+
     return f"Phone numbers for {name}: {', '.join(phones)}"
 
 
@@ -102,7 +104,7 @@ def show_all_contacts(book: AddressBook) -> str:
     Returns:
         str: A list of all contacts in the address book or a message if no contacts are available.
     """
-    if not book.data:
+    if not book:
         return "No contacts available."
     
     contact_list = "\n".join(str(record) for record in book.values())
@@ -17,6 +17,7 @@ def main():
         if command in ["close", "exit"]:
             print("Good bye!")
             save_data(book)
+            print("The address book has been successfully saved!")
             break
         elif command == "hello":
             print("How can I help you?")
@@ -2,32 +2,155 @@
 This module defines the `AddressBook` class which manages multiple `Record` objects.
 """
 
-from collections import UserDict
-from .record import Record, Birthday
-from datetime import datetime, timedelta
+import pickle
+from array import array
+from bisect import bisect_left
+from .record import Record
+from calendar import isleap
+from datetime import date, datetime, timedelta
 from typing import Optional, Dict, List
 
-class AddressBook(UserDict):
-    def __init__(self):
+# Birthday index keys (month * 32 + day) the Feb 29 handling cares about.
+_FEB29_KEY = 2 * 32 + 29
+_MAR1_KEY = 3 * 32 + 1
+
+class AddressBook(dict):
+    # Cached (month * 32 + day, name) pairs used by the birthday scan.
+    # None means the cache is stale and must be rebuilt; the class-level
+    # default also covers instances loaded from older pickles.
+    _bday_idx = None
+
+    def __reduce_ex__(self, protocol):
+        """
+        Reduce the address book for pickling.
+
+        For protocol 5+ the whole book is flattened into a few contiguous
+        buffers wrapped in `pickle.PickleBuffer` (PEP 574): one UTF-8 string
+        table holding every name, birthday and phone, an offset array into
+        that table, and a per-record phone count array. This avoids the
+        per-Record generic object pickling overhead and enables zero-copy
+        out-of-band transfer. Older protocols fall back to the default
+        behavior.
+
+        Args:
+            protocol (int): The pickle protocol in use.
+
+        Returns:
+            tuple: A `(callable, args)` pair as expected by pickle.
+        """
+        if protocol < 5:
+            return super().__reduce_ex__(protocol)
+
+        pieces = []
+        phone_counts = array('I')
+        for record in self.values():
+            pieces.append(record._key)
+            if record.birthday is not None:
+                # Explicit padding: strftime does not zero-pad years below
+                # 1000, which parse_birthday would reject on load.
+                bday = record.birthday.value
+                pieces.append(f"{bday.day:02d}.{bday.month:02d}.{bday.year:04d}")
+            else:
+                pieces.append("")
+            phones = [phone.value for phone in record.phones]
+            phone_counts.append(len(phones))
+            pieces.extend(phones)
+
+        offsets = array('I', [0])
+        encoded = []
+        position = 0
+        for piece in pieces:
+            data = piece.encode("utf-8")
+            encoded.append(data)
+            position += len(data)
+            offsets.append(position)
+
+        return (
+            AddressBook._reconstruct,
+            (
+                pickle.PickleBuffer(b"".join(encoded)),
+                pickle.PickleBuffer(offsets),
+                pickle.PickleBuffer(phone_counts),
+            ),
+        )
+
+    def __setstate__(self, state):
+        """
+        Restore the address book from pickled state.
+
+        Books saved by the earlier UserDict-based class carry their records
+        in a 'data' entry; those are poured into the mapping itself so
+        legacy pickles load into the dict instead of a dead attribute.
+
+        Args:
+            state (dict): The pickled instance state to restore.
+        """
+        data = state.pop('data', None)
+        if data is not None:
+            self.update(data)
+            # Legacy records predate the _book backref, so wire it up here
+            # or add_birthday would never invalidate the birthday index.
+            for record in data.values():
+                record._book = self
+        self.__dict__.update(state)
+
+    @classmethod
+    def _reconstruct(cls, table, offsets_buf, counts_buf) -> "AddressBook":
         """
-        Initialize an empty address book.
+        Rebuild an address book from the buffers produced by `__reduce_ex__`.
+
+        Args:
+            table (bytes-like): UTF-8 string table with all names, birthdays and phones.
+            offsets_buf (bytes-like): Packed uint32 offsets into the string table.
+            counts_buf (bytes-like): Packed uint32 phone counts, one per record.
+
+        Returns:
+            AddressBook: The reconstructed address book.
         """
-        super().__init__()
+        table = memoryview(table)
+        offsets = array('I')
+        offsets.frombytes(bytes(offsets_buf))
+        phone_counts = array('I')
+        phone_counts.frombytes(bytes(counts_buf))
 
-    def add_record(self, record: Record) -> str:
+        def piece(index):
+            return bytes(table[offsets[index]:offsets[index + 1]]).decode("utf-8")
+
+        book = cls()
+        index = 0
+        for count in phone_counts:
+            record = Record(piece(index))
+            birthday = piece(index + 1)
+            if birthday:
+                record.add_birthday(birthday)
+            index += 2
+            for _ in range(count):
+                record.add_phone(piece(index))
+                index += 1
+            book.add_record(record)
+        return book
+
+    def add_record(self, record: Record) -> bool:
         """
         Add a new record to the address book.
 
         Args:
             record (Record): The record to add.
 
-        Notes:
-            Prints a confirmation message if the record is added successfully.
+        Returns:
+            bool: True if the record was added, False if a contact with
+                  the same name already exists.
         """
-        self.data[record.name.value] = record
-        return f"Contact '{record.name.value}' added successfully."
-        
-        
+        key = record._key
+        if key in self:
+            return False
+        self[key] = record
+        record._book = self
+        self._bday_idx = None
+        return True
+
+
+
     def find(self, name: str) -> Optional[Record]:
         """
         Find a record by name.
@@ -36,16 +159,9 @@ class AddressBook(UserDict):
             name (str): The name of the record to find.
 
         Returns:
-            Record: The record if found.
-
-        Raises:
-            ValueError: If no record with the given name is found in the address book.
+            Record or None: The record if found, else None.
         """
-        if name in self.data:
-            print(f"Contact with name '{name}' was found!")
-            return self.data[name]
-        else:
-            return None
+        return self.get(name)
         
         
     def delete(self, name: str) -> None:
@@ -57,13 +173,10 @@ class AddressBook(UserDict):
 
         Raises:
             ValueError: If no record with the given name is found in the address book.
-
-        Notes:
-            Prints a confirmation message if the record is deleted successfully.
         """
-        if name in self.data:
-            del self.data[name]
-            print(f"Contact '{name}' has been successfully deleted.")
+        if name in self:
+            del self[name]
+            self._bday_idx = None
         else:
             raise ValueError(f"Record with name '{name}' not found.")
         
@@ -76,31 +189,71 @@ class AddressBook(UserDict):
             list[dict]: A list of dictionaries, each containing the contact name and 
                         their congratulation date formatted as "DD.MM.YYYY".
         """
+        if self._bday_idx is None:
+            self._bday_idx = self._build_bday_idx()
+        idx = self._bday_idx
+
         today = datetime.today().date()
         end_date = today + timedelta(days=7)
+        this_year = today.year
+        today_key = today.month * 32 + today.day
+        end_key = end_date.month * 32 + end_date.day
+
+        # The index is sorted by key, so the window maps to one slice found
+        # by bisection -- or two when it wraps past New Year -- and only
+        # matching contacts are visited at all.
+        if today_key <= end_key:
+            segments = [(today_key, end_key, this_year)]
+        else:
+            segments = [
+                (today_key, 12 * 32 + 31, this_year),
+                (0, end_key, this_year + 1),
+            ]
+
         result = []
+        for low_key, high_key, year in segments:
+            entries = idx[bisect_left(idx, (low_key,)):bisect_left(idx, (high_key + 1,))]
+            if not isleap(year) and low_key > _FEB29_KEY and low_key <= _MAR1_KEY <= high_key:
+                # In non-leap years Feb 29 contacts are celebrated on Mar 1,
+                # so their key sits below a window that starts after Feb 29
+                # but still covers Mar 1.
+                entries = idx[bisect_left(idx, (_FEB29_KEY,)):bisect_left(idx, (_FEB29_KEY + 1,))] + entries
+            for key, contact in entries:
+                month, day = key >> 5, key & 31
+                if month == 2 and day == 29 and not isleap(year):
+                    # Feb 29 birthdays are celebrated on Mar 1 in non-leap years.
+                    month, day = 3, 1
 
-        for contact, details in self.data.items():
-            birthday_field = details.birthday
+                congratulation_date = self.calculate_next_weekday(date(year, month, day))
 
-            if not self.is_valid_birthday(birthday_field):
-                continue
+                result.append({
+                    "contact_name": contact,
+                    "congratulation_date": congratulation_date.strftime("%d.%m.%Y")
+                })
 
-            contact_birthday = birthday_field.value
+        return result
+
+
+    def _build_bday_idx(self) -> List[tuple]:
+        """
+        Build the flat birthday index from the current records.
+
+        Returns:
+            list[tuple]: (month * 32 + day, name) pairs for every contact
+                         with a valid birthday, sorted by key so the scan
+                         can bisect to the matching range.
+        """
+        return sorted(
+            (details.birthday.value.month * 32 + details.birthday.value.day, contact)
+            for contact, details in self.items()
+            if self.is_valid_birthday(details.birthday)
+        )
 
-            congratulation_date = self.calculate_congratulation_date(contact_birthday, today, end_date)
 
-            result.append({
-                "contact_name": contact,
-                "congratulation_date": congratulation_date.strftime("%d.%m.%Y")
-            })
 
-        return result
-    
-    
     def is_valid_birthday(self, birthday_field) -> bool:
         """
-        Validate if the birthday field is a proper Birthday object with a non-None value.
+        Validate that the birthday field is set and holds a non-None value.
 
         Args:
             birthday_field (Optional[Birthday]): The field to validate.
@@ -108,38 +261,9 @@ class AddressBook(UserDict):
         Returns:
             bool: True if valid, otherwise False.
         """
-        return isinstance(birthday_field, Birthday) and birthday_field.value is not None
+        return birthday_field is not None and birthday_field.value is not None
     
     
-    def calculate_congratulation_date(self, contact_birthday: datetime.date, today: datetime.date, end_date: datetime.date) -> datetime.date:
-        """
-        Calculate the congratulation date based on the contact's birthday.
-
-        Args:
-            contact_birthday (datetime.date): The contact's birthday.
-            today (datetime.date): Today's date.
-            end_date (datetime.date): The end date of the 7-day period.
-
-        Returns:
-            datetime.date: The congratulation date, adjusted if necessary.
-        """
-        try:
-            birthday_this_year = contact_birthday.replace(year=today.year)
-
-            # If the birthday has already occurred this year, set it to next year
-            if birthday_this_year < today:
-                birthday_this_year = birthday_this_year.replace(year=today.year + 1)
-
-            # Check if the birthday is within the next 7 days
-            if today <= birthday_this_year <= end_date:
-                return self.calculate_next_weekday(birthday_this_year)
-            else:
-                return birthday_this_year
-
-        except Exception as ex:
-            raise ValueError(f"Error calculating congratulation date: {ex}")
-    
-
     def calculate_next_weekday(self, date: datetime.date) -> datetime.date:
         """
         Calculate the next weekday if the given date falls on a weekend.
@@ -2,8 +2,7 @@
 This module defines the `Field` class and its subclasses `Name`, `Phone`, and `Birthday`.
 """
 
-import re
-from datetime import datetime
+from datetime import date
 
 class Field:
     """
@@ -17,6 +16,8 @@ class Field:
         __str__(): Returns the string representation of the field's value.
     """
 
+    __slots__ = ('value',)
+
     def __init__(self, value):
         """
         Initialize the field with a value.
@@ -35,6 +36,21 @@ class Field:
         """
         return str(self.value)
 
+    def __setstate__(self, state):
+        """
+        Restore the field from pickled state.
+
+        Accepts both the slotted state written by current code and the
+        plain __dict__ state written before __slots__ was introduced.
+
+        Args:
+            state (tuple or dict): The pickled state to restore.
+        """
+        if isinstance(state, tuple):
+            dict_state, slot_state = state
+            state = {**(dict_state or {}), **(slot_state or {})}
+        self.value = state['value']
+
 
 class Name(Field):
     """
@@ -45,7 +61,7 @@ class Name(Field):
     This class does not add any additional functionality to `Field` but is used
     for type distinction and future extension.
     """
-    pass
+    __slots__ = ()
 
 
 class Phone(Field):
@@ -62,6 +78,8 @@ class Phone(Field):
         validate_phone(value: str) -> str: Validates the phone number format.
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str):
         """
         Initialize a Phone instance with validation.
@@ -87,9 +105,7 @@ class Phone(Field):
         Raises:
             ValueError: If the phone number is invalid. Phone number must contain exactly 10 digits.
         """
-        phone_pattern = re.compile(r'^\d{10}$')
-        
-        if not phone_pattern.match(value):
+        if len(value) != 10 or not value.isascii() or not value.isdigit():
             raise ValueError(f"Invalid phone number: {value}. Phone number must contain exactly 10 digits.")
 
         return value
@@ -108,6 +124,8 @@ class Birthday(Field):
         parse_birthday(value: str) -> datetime: Parses the date string and returns a datetime object.
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str):
         """
         Initialize the Birthday instance with a date string.
@@ -120,20 +138,25 @@ class Birthday(Field):
         """
         self.value = self.parse_birthday(value)
     
-    def parse_birthday(self, value: str) -> datetime.date:
+    def parse_birthday(self, value: str) -> date:
         """
-        Parses the date string and returns a datetime object.
+        Parses the date string and returns a date object.
+
+        The fixed DD.MM.YYYY shape is parsed by slicing, which avoids the
+        format-string interpreter of `datetime.strptime`.
 
         Args:
             value (str): The date in DD.MM.YYYY format.
 
         Returns:
-            datetime: The parsed date.
+            date: The parsed date.
 
         Raises:
             ValueError: If the date format is invalid.
         """
+        if len(value) != 10 or value[2] != '.' or value[5] != '.':
+            raise ValueError("Invalid date format. Use DD.MM.YYYY")
         try:
-            return datetime.strptime(value, "%d.%m.%Y").date()
+            return date(int(value[6:10]), int(value[3:5]), int(value[0:2]))
         except ValueError:
             raise ValueError("Invalid date format. Use DD.MM.YYYY")
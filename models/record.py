@@ -3,19 +3,40 @@ This module defines the `Record` class which manages contact details.
 """
 
 from .field import Name, Phone, Birthday
-from typing import Optional, List
+from typing import Optional, Dict
 
 class Record:
+    __slots__ = ('name', '_key', '_phones', 'birthday', '_book',
+                 '_version', '_str_cache', '_cache_v')
+
     def __init__(self, name: str):
         """
-        Initialize the record with a name and an empty list of phones.
+        Initialize the record with a name and an empty collection of phones.
 
         Args:
             name (str): The name of the contact.
         """
         self.name = Name(name)
-        self.phones: List[Phone] = []
+        # Cached copy of name.value so hot paths skip the attribute chain.
+        self._key = name
+        self._phones: Dict[str, Phone] = {}
         self.birthday: Optional[Birthday] = None
+        self._book = None
+        # Mutation counter plus cached __str__; the cache is valid while
+        # _cache_v matches _version.
+        self._version = 0
+        self._str_cache = None
+        self._cache_v = -1
+
+    @property
+    def phones(self):
+        """
+        A view of the record's `Phone` objects, in insertion order.
+
+        Returns:
+            dict_values[Phone]: The phone numbers stored in the record.
+        """
+        return self._phones.values()
 
     def add_phone(self, phone: str) -> None:
         """
@@ -24,7 +45,9 @@ class Record:
         Args:
             phone (str): The phone number to add.
         """
-        self.phones.append(Phone(phone))
+        new_phone = Phone(phone)
+        self._phones[new_phone.value] = new_phone
+        self._version += 1
 
     def remove_phone(self, phone: str) -> None:
         """
@@ -33,7 +56,8 @@ class Record:
         Args:
             phone (str): The phone number to remove.
         """
-        self.phones = list(filter(lambda item: item.value != phone, self.phones))
+        if self._phones.pop(phone, None) is not None:
+            self._version += 1
 
     def edit_phone(self, old_phone: str, new_phone: str) -> str:
         """
@@ -49,11 +73,13 @@ class Record:
         If the old phone number is found and replaced, returns "Phone number successfully updated."
         If the old phone number is not found, returns "Phone number not found."
         """
-        phone_to_edit = next((phone for phone in self.phones if phone.value == old_phone), None)
-        if phone_to_edit:
-            phone_to_edit.value = Phone(new_phone).value
-            return "Phone number successfully updated."
-        return "Phone number not found."
+        if old_phone not in self._phones:
+            return "Phone number not found."
+        phone = Phone(new_phone)
+        del self._phones[old_phone]
+        self._phones[phone.value] = phone
+        self._version += 1
+        return "Phone number successfully updated."
     
 
     def find_phone(self, phone: str) -> Optional[Phone]:
@@ -66,7 +92,7 @@ class Record:
         Returns:
             Phone or None: The phone number if found, else None.
         """
-        return next((item for item in self.phones if item.value == phone), None)
+        return self._phones.get(phone)
     
     def add_birthday(self, birthday: str) -> str:
         """
@@ -83,16 +109,60 @@ class Record:
         """
         if not self.birthday:
             self.birthday = Birthday(birthday)
+            self._version += 1
+            book = getattr(self, '_book', None)
+            if book is not None:
+                book._bday_idx = None
             return "Birthday successfully added!"
         return "Birthday already exists!"
 
+    def __setstate__(self, state):
+        """
+        Restore the record from pickled state.
+
+        Accepts both the slotted state written by current code and the
+        plain __dict__ state written before __slots__ was introduced,
+        converting the legacy phone list into the phone dict and filling
+        in attributes older records never had.
+
+        Args:
+            state (tuple or dict): The pickled state to restore.
+        """
+        if isinstance(state, tuple):
+            dict_state, slot_state = state
+            state = {**(dict_state or {}), **(slot_state or {})}
+        else:
+            state = dict(state)
+
+        phones = state.pop('phones', None)
+        if phones is not None:
+            state['_phones'] = {phone.value: phone for phone in phones}
+        state.setdefault('_key', state['name'].value)
+        state.setdefault('birthday', None)
+        state.setdefault('_book', None)
+        state.setdefault('_version', 0)
+        state.setdefault('_str_cache', None)
+        state.setdefault('_cache_v', -1)
+
+        for attr, value in state.items():
+            setattr(self, attr, value)
+
     def __str__(self) -> str:
         """
         Return a string representation of the record.
 
+        The formatted string is cached and reused until the record is
+        mutated again, so repeated listings do not re-format unchanged
+        contacts.
+
         Returns:
             str: A formatted string containing the contact's name, phone numbers, and birthday.
         """
-        phones_str = ', '.join(p.value for p in self.phones)
+        if self._str_cache is not None and self._cache_v == self._version:
+            return self._str_cache
+
+        phones_str = ', '.join(self._phones)
         birthday_str = self.birthday.value if self.birthday else "Not set"
-        return f"Name: {self.name.value}, Phones: {phones_str}, Birthday: {birthday_str}"
+        self._str_cache = f"Name: {self._key}, Phones: {phones_str}, Birthday: {birthday_str}"
+        self._cache_v = self._version
+        return self._str_cache